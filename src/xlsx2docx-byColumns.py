@@ -13,18 +13,45 @@ __email__      = "ernst@grossmusik.de"
 __status__     = "Development"
 __credits__    = [ "" ]
 
+import concurrent.futures
+import datetime
+import io
+import logging
+import multiprocessing
 import os
+import re
 import sys
 import time
 
+# tomllib is part of the standard library since Python 3.11 and is only able to read.
+# tomlkit is only needed to write the default configuration file.
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
 import tomlkit
-from tomlkit.toml_document import TOMLDocument
 from tomlkit.toml_file     import TOMLFile
 
 import openpyxl 
 from openpyxl.utils import get_column_letter, column_index_from_string
 
+# python-calamine is an optional dependency. Its reader is implemented in Rust and is much faster than openpyxl.
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
 import docx
+from docx.oxml.ns import qn
+
+log = logging.getLogger(__name__)
+
+# pyahocorasick is an optional dependency. It finds all replace strings in a single pass over a text.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 ##################################################################################################################################################
@@ -53,6 +80,10 @@ contentColumns = [
 [template]
 filename = "src/xlsx2docx-byColumns_TemplateExample.docx"
 
+# Optional: If true, replaced paragraph text is written into the existing text runs of the paragraph.
+# This is faster, but the runs keep their character formatting, tabs, breaks or images.
+fastTextReplace = false
+
 [generatedData]
 # "filenames" must correspont to the "sourceData.contentColumns". 
 # That means identical number of elements and same sequence.
@@ -71,38 +102,80 @@ def getCurrentTimeAsString():
     return time.strftime("%Y-%m-%d_%H%M%S")
 
 
-def appendTimestampToFilename(filename):
+def appendTimestampToFilename(filename, timestamp=None):
     """Append the current time to a given filename. Example: "bla.txt" => "bla_2020-08-19_151221.txt".
+    If a timestamp string is given, it is used instead of the current time.
     Returns a string with the new timestamped filename.
     """
 
+    if timestamp is None:
+        timestamp = getCurrentTimeAsString()
+
     name, ext = os.path.splitext(filename)
-    return "{name}_{uid}{ext}".format(name=name, uid=getCurrentTimeAsString(), ext=ext)
+    return "{name}_{uid}{ext}".format(name=name, uid=timestamp, ext=ext)
 
 
 def ensureDirectoryExists(filename):
     """Ensure that the given directory exists. 
     If not then the directory structure will be made recursive to all levels given in the filename.
+    A filename without directory refers to the current directory, which exists already.
     """
 
     baseFolder = os.path.dirname(filename)
-    os.makedirs(baseFolder, exist_ok=True)
+    if baseFolder:
+        os.makedirs(baseFolder, exist_ok=True)
 
 
 def appendTimestampToFilenames(filenames):
     """Append the current time to a list of given filename. Example: "bla.txt" => "bla_2020-08-19_151221.txt".
+    All filenames get the same timestamp, even if the time passes to the next second meanwhile.
     Returns a list of strings with timestamped filenames.
     """
 
+    timestamp = getCurrentTimeAsString()
     filenamesWithTimestamp = []
+    ensuredDirectories = set()
    
     for filename in filenames:
-        filenamesWithTimestamp.append(appendTimestampToFilename(filename))
-        ensureDirectoryExists(filename)
+        filenameWithTimestamp = appendTimestampToFilename(filename, timestamp)
+        filenamesWithTimestamp.append(filenameWithTimestamp)
+
+        directory = os.path.dirname(filenameWithTimestamp)
+        if directory not in ensuredDirectories:
+            ensureDirectoryExists(filenameWithTimestamp)
+            ensuredDirectories.add(directory)
 
     return filenamesWithTimestamp
 
-def replaceInParagraph(para, replace, content, style, contextString):
+# If True, replaced paragraph text is written directly into the existing text elements of the paragraph.
+# This is faster than setting docx.Paragraph.text, which removes all runs and adds a new one.
+# But the runs keep their character formatting and non text content as tabs, breaks or images.
+# It is set per worker process by initGenerateDocxWorker() from the configuration "template.fastTextReplace".
+useFastTextReplace = False
+
+
+def setParagraphText(para, content):
+    """Set the text of the given paragraph to the given content.
+    See useFastTextReplace. The fast path is only used for a single line of text without tabs and if the paragraph contains text.
+    """
+
+    if useFastTextReplace and isinstance(content, str) and not any(character in content for character in "\t\n\r"):
+        textElements = para._p.xpath("./w:r/w:t | ./w:hyperlink/w:r/w:t")
+
+        if textElements:
+            textElements[0].text = content
+            if content != content.strip():
+                textElements[0].set(qn("xml:space"), "preserve")
+
+            for textElement in textElements[1:]:
+                textElement.getparent().remove(textElement)
+
+            return
+
+    para.text = content
+
+
+def replaceInParagraph(para, replace, content, style, contextString, text=None):
     """Search for replace string in the given paragraph and replace it with the given content and style.
 
      Parameters
@@ -115,6 +188,8 @@ def replaceInParagraph(para, replace, content, style, contextString):
         This content will be used to set as paragraph where the replace string is found.
     style : string
         Name of the style that will be used for the paragraph. If style is 'None', the original style of the paragraph is unchanged.
+    text : string
+        The current text of the paragraph, if it is already known to the caller.
     
     Returns
     -------
@@ -123,19 +198,35 @@ def replaceInParagraph(para, replace, content, style, contextString):
    
     """
 
-    if replace in para.text:
-        print("In ", contextString, ": replace_paragraph: '", para.text, "' \tby '", content, "'", sep="")
-        para.text = content
+    # para.text concatenates all runs of the paragraph on each access, therefore it is read only once.
+    if text is None:
+        text = para.text
+
+    if replace not in text:
+        return para
 
-        if style and style != "None":
-            print("Set style to '", style, "'", sep="")
-            para.style = style
+    log.debug("In %s: replace_paragraph: '%s' \tby '%s'", contextString, text, content)
+    setParagraphText(para, content)
+
+    if style and style != "None":
+        log.debug("Set style to '%s'", style)
+        para.style = style
     
     return para
 
 
-def replaceParagraphInDoc(doc, replace, content, style):
-    """Search for replace string in all paragraphs in the given document and replace them with the given content and style.
+def iterTableParagraphs(tables):
+    """Yield all paragraphs in the cells of the given tables.
+    """
+
+    for table in tables:
+        for row in table.rows:
+            for cell in row.cells:
+                yield from cell.paragraphs
+
+
+def iterAllParagraphs(doc):
+    """Yield all paragraphs in the given document together with a string that names where the paragraph was found.
 
     The current implementation of docx supports paragraphs in:
     1. document
@@ -145,61 +236,184 @@ def replaceParagraphInDoc(doc, replace, content, style):
         b) header tables
         b) footer 
         c) footer tables
-    
+
+    Parameters
+    ----------
+    doc : docx.Document
+        The docx.Document to be searched.
+
+    Yields
+    ------
+    (contextString, para) : (string, docx.Paragraph)
+        The location of the paragraph in the document and the paragraph itself.
+    """
+
+    for para in doc.paragraphs:
+        yield "doc.paragraphs", para
+
+    for para in iterTableParagraphs(doc.tables):
+        yield "doc.tables", para
+
+    for section in doc.sections:
+        # header and footer are properties that create a new object on each access.
+        header = section.header
+        footer = section.footer
+
+        for para in header.paragraphs:
+            yield "section.header", para
+
+        for para in iterTableParagraphs(header.tables):
+            yield "section.header.tables", para
+
+        for para in footer.paragraphs:
+            yield "section.footer", para
+
+        for para in iterTableParagraphs(footer.tables):
+            yield "section.footer.tables", para
+
+
+def compileReplaceMatcher(replaces):
+    """Compile a function that finds the given replace strings in a text.
+    An Aho-Corasick automaton of pyahocorasick is used if it is installed, 
+    otherwise a regular expression skips texts quickly that do not contain any replace string.
+
+    Parameters
+    ----------
+    replaces : iterable of string
+        The replace strings. Must not be empty.
+
+    Returns
+    -------
+    findReplaces : function(string) -> set of string
+        Returns the replace strings contained in the given text.
+    """
+
+    replaces = set(replaces)
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for replace in replaces:
+            automaton.add_word(replace, replace)
+        automaton.make_automaton()
+
+        return lambda text: {replace for end, replace in automaton.iter(text)}
+
+    pattern = re.compile("|".join(map(re.escape, replaces)))
+
+    def findReplaces(text):
+        if pattern.search(text) is None:
+            return set()
+        # The matches of the pattern do not overlap, so check each replace string.
+        return {replace for replace in replaces if replace in text}
+
+    return findReplaces
+
+
+def replaceAllInParagraph(para, replacements, indexesByReplace, findReplaces, contextString):
+    """Search for all replace strings in the given paragraph and replace it with the corresponding content and style.
+
+    Parameters
+    ----------
+    para : docx.Paragraph
+        The docx.Paragraph that will be edited.
+    replacements : list of tuple
+        The (replace, content, style) of each replacement. The replacements are applied in the sequence of the list.
+    indexesByReplace : dict
+        Maps each replace string to the ascending indexes of its replacements.
+    findReplaces : function(string) -> set of string
+        See compileReplaceMatcher().
+
+    Returns
+    -------
+    para: docx.Paragraph
+        The edited docx.Paragraph.
+    """
+
+    text = para.text
+    foundReplaces = findReplaces(text)
+    nextIndex = 0
+
+    # Apply the replacements in sequence, so that a later replace string can match the content of a former one.
+    # Only the replacements of the found replace strings are visited.
+    while foundReplaces:
+        indexes = [index for replace in foundReplaces for index in indexesByReplace[replace] if index >= nextIndex]
+        if not indexes:
+            break
+
+        index = min(indexes)
+        replace, content, style = replacements[index]
+        para = replaceInParagraph(para, replace, content, style, contextString, text)
+
+        # The text changed, only the later replacements can match the new text.
+        text = para.text
+        foundReplaces = findReplaces(text)
+        nextIndex = index + 1
+
+    return para
+
+
+def replaceAllInDoc(doc, replacements):
+    """Search for all replace strings in all paragraphs in the given document and replace them with the corresponding content and style.
+    The document is traversed only once for all replace strings.
+
     Parameters
     ----------
     doc : docx.Document
         The docx.Document that will be edited.
-    replace : string
-        If the replace string is found, the complete paragraph is set to the given conten.
-    content: string
-        This content will be used to set as paragraph where the replace string is found.
-    style : string
-        Name of the style that will be used for the paragraph. If style is 'None', the original style of the paragraph is unchanged.
-    
+    replacements : list of tuple
+        The (replace, content, style) of each replacement in the sequence of the rows.
+        If the replace string is found, the complete paragraph is set to the content.
+        If style is empty or 'None', the original style of the paragraph is unchanged.
+
     Returns
     -------
     doc: docx.Document
         The edited docx.Document.
     """
 
-    # #############################################
-    # Search in normal paragraphs of the document.
-    # #############################################
-    for para in doc.paragraphs:
-        para = replaceInParagraph(para, replace, content, style, contextString="doc.paragraphs")
+    if not replacements:
+        return doc
+
+    indexesByReplace = {}
+    for index, (replace, content, style) in enumerate(replacements):
+        indexesByReplace.setdefault(replace, []).append(index)
+
+    findReplaces = compileReplaceMatcher(indexesByReplace)
+
+    for contextString, para in iterAllParagraphs(doc):
+        para = replaceAllInParagraph(para, replacements, indexesByReplace, findReplaces, contextString)
+
+    return doc
+
+
+def addParagraphsToDoc(doc, paragraphsToAdd):
+    """Add/append new paragraphs to the given document.
+
+    Parameters
+    ----------
+    doc : docx.Document
+        The docx.Document that will be edited.
+    paragraphsToAdd : list of tuple
+        The (content, style) of each paragraph. If style is empty or 'None', the default paragraph style defined in the template is used.
+
+    Returns
+    -------
+    doc: docx.Document
+        The edited docx.Document.
+    """
+
+    addParagraph = doc.add_paragraph
+    styles = doc.styles
+
+    # Resolving a style by its name searches the styles of the document, so each name is resolved only once.
+    stylesByName = {}
+
+    for content, style in paragraphsToAdd:
+        if style not in stylesByName:
+            stylesByName[style] = styles[style] if style and style != "None" else None
+
+        addParagraph(content, style=stylesByName[style])
 
-    # #############################################
-    # Search in tables of the document for paragraphs.
-    # #############################################
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for para in cell.paragraphs:
-                    para = replaceInParagraph(para, replace, content, style, contextString="doc.tables")
-    
-    # ###################################################################################
-    # Search in all sections in their footer and header and their tables for paragraphs.
-    # ###################################################################################
-    for section in doc.sections:
-        for para in section.header.paragraphs:
-            para = replaceInParagraph(para, replace, content, style, contextString="section.header")
-
-        for table in section.header.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for para in cell.paragraphs:
-                        para = replaceInParagraph(para, replace, content, style, contextString="section.header.tables")
-
-        for para in section.footer.paragraphs:
-            para = replaceInParagraph(para, replace, content, style, contextString="section.footer")
-
-        for table in section.footer.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for para in cell.paragraphs:
-                        para = replaceInParagraph(para, replace, content, style, contextString="section.footer.tables")
-    
     return doc
 
 
@@ -215,25 +429,165 @@ def getUsername():
         The username from the environment variables.
     """
 
-    username = "unknown"
-
     if os.name == "nt":
-        username = os.environ["USERNAME"]
+        username = os.environ.get("USERNAME", "unknown")
     else:
-        username = os.environ["USER"]
+        username = os.environ.get("USER", "unknown")
     
     return username
 
 
-def generateDocxFromXlsx(sheet, contentStartRow, commandColumn, styleColumn, replaceColumn, contentColumns, templateFilename, outputFilenames):
-    """Generate the output docx files from the input xlsx sheet.
+# The username does not change while running, so it is resolved only once.
+currentUsername = getUsername()
+
+
+def handleReplaceParagraph(replacements, paragraphsToAdd, replace, content, style):
+    """Handle the command replace_paragraph of a row. The replacement is collected to be applied by replaceAllInDoc().
+    """
+
+    if replace:
+        replacements.append((replace, content, style))
+
+
+def handleAddParagraph(replacements, paragraphsToAdd, replace, content, style):
+    """Handle the command add_paragraph of a row. The paragraph is collected to be added after the replacements.
+    """
+
+    if content:
+        paragraphsToAdd.append((content, style))
+
+
+# Maps the supported commands of the command column to their handler.
+commandHandlers = {
+    "replace_paragraph" : handleReplaceParagraph ,
+    "add_paragraph"     : handleAddParagraph     ,
+}
+
+
+def planRowCommands(rows, commandIndex, replaceIndex, styleIndex, getHandler=commandHandlers.get, logWarning=log.warning):
+    """Decode the commands of the given rows once for all output files.
+    Only the content differs between the output files, the command, replace string and style are the same.
+    The column indexes start at 0. getHandler and logWarning are bound as default arguments, 
+    so they are local variables in the loop that runs once per row.
+
+    Returns
+    -------
+    (commandPlan, plannedRows) : (list of tuple, list of tuple)
+        The commandPlan contains a tuple of (handleCommand, replace, style) for each row with a supported command.
+        The plannedRows are the corresponding rows to take the content of each output file from.
+    """
+
+    commandPlan = []
+    plannedRows = []
+
+    for row in rows:
+        command = row[commandIndex]
+
+        if command: 
+            handleCommand = getHandler(command.strip())
+            if handleCommand is None:
+                logWarning("Unexpected object: %s", command)
+                continue
+
+            commandPlan.append((handleCommand, row[replaceIndex], row[styleIndex]))
+            plannedRows.append(row)
+
+    return commandPlan, plannedRows
+
+
+def collectRowCommands(commandPlan, contents):
+    """Collect the replacements and the paragraphs to add for one output file.
+
+    Parameters
+    ----------
+    commandPlan : list of tuple
+        See planRowCommands().
+    contents : list
+        The content of the output file for each entry of the commandPlan.
+
+    Returns
+    -------
+    (replacements, paragraphsToAdd) : (list of tuple, list of tuple)
+        See replaceAllInDoc() for the replacements. The paragraphs to add are tuples of (content, style) in the sequence of the rows.
+    """
+
+    replacements = []
+    paragraphsToAdd = []
+
+    for (handleCommand, replace, style), content in zip(commandPlan, contents):
+        handleCommand(replacements, paragraphsToAdd, replace, content, style)
+
+    return replacements, paragraphsToAdd
+
+
+# The content of the template file and the command plan. They are set once per worker process by initGenerateDocxWorker().
+workerTemplateBytes = None
+workerCommandPlan = None
+
+
+def initGenerateDocxWorker(templateBytes, commandPlan, fastTextReplace, logLevel):
+    """Initialize a worker process for generateDocxFromPlan().
+    The template file content and the command plan are passed once per worker process, instead of for each output file.
+    The fastTextReplace flag and the log level are passed, because a spawned worker process does not inherit 
+    the module state and the logging configuration of main().
+    """
+
+    logging.basicConfig(level=logLevel, format="%(message)s", stream=sys.stdout)
+
+    global workerTemplateBytes, workerCommandPlan, useFastTextReplace
+    workerTemplateBytes = templateBytes
+    workerCommandPlan = commandPlan
+    useFastTextReplace = fastTextReplace
+
+
+def generateDocxFromPlan(templateFilename, outputFilename, contents, author):
+    """Generate one output docx file from the command plan and the contents of this output file.
+    This function is executed in a worker process, therefore only plain picklable data is passed.
+    The template and the command plan are taken from initGenerateDocxWorker(), the templateFilename is only printed.
+
+    Parameters
+    ----------
+    templateFilename : string
+        The template filename
+    outputFilename : string
+        The filename of the generated output file.
+    contents : list
+        The content of this output file for each entry of the command plan, see planRowCommands().
+    author : string
+        The author set in the core properties of the generated file.
+
+    Returns
+    -------
+    nothing
+    """
+    #######################################################################################
+    log.info("Generate timestamped output file: '%s' based on template: '%s'", outputFilename, templateFilename)
+    #######################################################################################
+    doc = docx.Document(io.BytesIO(workerTemplateBytes))
+
+    doc.core_properties.author = author
+
+    # Collect the replacements and the paragraphs to add first.
+    # So the document is searched only once for all replace strings, instead of once per row.
+    replacements, paragraphsToAdd = collectRowCommands(workerCommandPlan, contents)
+
+    doc = replaceAllInDoc(doc=doc, replacements=replacements)
+
+    doc = addParagraphsToDoc(doc=doc, paragraphsToAdd=paragraphsToAdd)
+
+    #######################################################################################
+    # print("Save to new generated MS-Word file:", outputFilename)
+    #######################################################################################
+    doc.save(outputFilename)
+
+
+def generateDocxFromXlsx(rows, commandColumn, styleColumn, replaceColumn, contentColumns, templateFilename, outputFilenames, fastTextReplace=False):
+    """Generate the output docx files from the input xlsx rows.
     
     Parameters
     ----------
-    sheet : openpyxl.sheet
-        Input data to generate the output.
-    contentStartRow : int (first row is 1)
-        Index of xlsx row where the content starts.
+    rows : list of tuple
+        Input data to generate the output. The cell values of the xlsx rows starting at the content start row, see readContentRows().
     commandColumn : int (first column is 1)
         Index of xlsx column of the commands. Supported commands are 
         1. replace_paragraph - searches for the replace string in all paragraphs of the document and if found the paragraph will be set to what is defined in the content cell.
@@ -251,6 +605,8 @@ def generateDocxFromXlsx(sheet, contentStartRow, commandColumn, styleColumn, rep
         The template filename
     outputFilenames : list of string
         The filenames of the generated output files.
+    fastTextReplace : bool
+        Write replaced paragraph text into the existing text elements, see useFastTextReplace.
 
     Returns
     -------
@@ -258,36 +614,42 @@ def generateDocxFromXlsx(sheet, contentStartRow, commandColumn, styleColumn, rep
     """
     outputGeneratedFilenamesWithTimestamp = appendTimestampToFilenames(outputFilenames)
 
-    for outputGeneratedFilenameWithTimestamp, contentColumn in zip(outputGeneratedFilenamesWithTimestamp, contentColumns):
-        #######################################################################################
-        print("\nGenerate timestamped output file: '", outputGeneratedFilenameWithTimestamp, "' based on template: '", templateFilename, "'", sep="")
-        #######################################################################################
-        doc = docx.Document(templateFilename)
-
-        doc.core_properties.author = getUsername()
-        print("author:", doc.core_properties.author)
-
-        for row in range(contentStartRow, sheet.max_row+1, 1):
-            command = sheet.cell(row=row, column=commandColumn ).value
-            replace = sheet.cell(row=row, column=replaceColumn ).value
-            content = sheet.cell(row=row, column=contentColumn ).value
-            style   = sheet.cell(row=row, column=styleColumn   ).value
-
-            if command: 
-                # print(command, style, content)
-
-                if "replace_paragraph" in command:
-                    doc = replaceParagraphInDoc(doc=doc, replace=replace, content=content, style=style)
-                elif "add_paragraph" in command:
-                    if content:
-                        doc.add_paragraph(content, style=style)
-                else:
-                    print("Unexpected object:", command, "with content:", content)
+    author = currentUsername
+    print("author:", author)
+
+    if not outputGeneratedFilenamesWithTimestamp:
+        return
+
+    # Each output file is independent from the others, so they are generated in parallel processes.
+    # The docx.Document is not passed to the workers, each worker parses the template by itself.
+    # The template file is read only once and its content is passed once to each worker process.
+    with open(templateFilename, "rb") as templateFile:
+        templateBytes = templateFile.read()
+
+    # The commands are decoded once, each worker process gets only the content column of its output file.
+    commandPlan, plannedRows = planRowCommands(
+        rows         = rows              ,
+        commandIndex = commandColumn - 1 ,
+        replaceIndex = replaceColumn - 1 ,
+        styleIndex   = styleColumn   - 1 ,
+        )
+
+    maxWorkers = min(len(outputGeneratedFilenamesWithTimestamp), os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=maxWorkers, initializer=initGenerateDocxWorker, initargs=(templateBytes, commandPlan, fastTextReplace, logging.getLogger().level)) as executor:
+        futures = [
+            executor.submit(
+                generateDocxFromPlan,
+                templateFilename = templateFilename                                ,
+                outputFilename   = outputGeneratedFilenameWithTimestamp            ,
+                contents         = [row[contentColumn - 1] for row in plannedRows] ,
+                author           = author                                          ,
+                )
+            for outputGeneratedFilenameWithTimestamp, contentColumn in zip(outputGeneratedFilenamesWithTimestamp, contentColumns)
+            ]
 
-        #######################################################################################
-        # print("Save to new generated MS-Word file:", outputGeneratedFilenameWithTimestamp)
-        #######################################################################################
-        doc.save(outputGeneratedFilenameWithTimestamp)
+        # Wait in the given sequence and reraise an exception of a worker.
+        for future in futures:
+            future.result()
 
 
 def generateDefaultConfigurationTomlFile(configurationFilename):
@@ -322,7 +684,8 @@ def loadConfiguration(configurationFilename):
     if not os.path.isfile(configurationFilename):
         generateDefaultConfigurationTomlFile(configurationFilename)
    
-    myConfig = tomlkit.toml_file.TOMLFile(configurationFilename).read()
+    with open(configurationFilename, "rb") as configurationFile:
+        myConfig = tomllib.load(configurationFile)
 
     return myConfig
 
@@ -333,7 +696,39 @@ def printAvailableWorksheetsIn(sourceDataFilename, xlsxWorkbook, contentSheetnam
     print("Available worksheets in '", sourceDataFilename, "' are: ", sep="")
     for sheetname in xlsxWorkbook.sheetnames:
         sheet = xlsxWorkbook[sheetname]
-        print(sheetname, "\tmax_row:", sheet.max_row, "\tmax_column:", sheet.max_column, end="")
+
+        # In read-only mode the dimensions are taken from the file as written by the application.
+        # Some applications write no dimensions or "A1:A1" although the sheet has more content, so force a recalculation.
+        try:
+            dimension = sheet.calculate_dimension()
+        except ValueError:
+            dimension = None
+
+        if dimension is None or dimension == "A1:A1":
+            sheet.reset_dimensions()
+            # The recalculation needs at least one row with a cell, an empty sheet keeps the dimensions None.
+            if any(sheet.iter_rows()):
+                sheet.calculate_dimension(force=True)
+
+        maxRow    = sheet.max_row
+        maxColumn = sheet.max_column
+        print(sheetname, "\tmax_row:", maxRow, "\tmax_column:", maxColumn, end="")
+
+        if sheetname == contentSheetname:
+            print(" Will be used to generate output files.")
+        else:
+            print("")
+
+
+def printAvailableCalamineWorksheetsIn(sourceDataFilename, calamineWorkbook, contentSheetname):
+    """Print available worksheets in given python-calamine workbook.
+    """
+    print("Available worksheets in '", sourceDataFilename, "' are: ", sep="")
+    for sheetname in calamineWorkbook.sheet_names:
+        sheet = calamineWorkbook.get_sheet_by_name(sheetname)
+        # end is the zero based (row, column) of the last used cell, or None for an empty sheet.
+        maxRow, maxColumn = (None, None) if sheet.end is None else (index + 1 for index in sheet.end)
+        print(sheetname, "\tmax_row:", maxRow, "\tmax_column:", maxColumn, end="")
 
         if sheetname == contentSheetname:
             print(" Will be used to generate output files.")
@@ -341,6 +736,100 @@ def printAvailableWorksheetsIn(sourceDataFilename, xlsxWorkbook, contentSheetnam
             print("")
 
 
+def readContentRowsWithOpenpyxl(sourceDataFilename, contentSheetname, contentStartRow, maxColumn):
+    """Read the content rows with openpyxl. See readContentRows().
+    """
+
+    # If data_only is true, then the formulas are replaced by value. 
+    # The values are not evaluated by docx. 
+    # The values were generated by MS-Excel at the time of last edit and stored within the file.
+    # If read_only is true, then the cells are streamed from the file instead of being loaded all at once into memory.
+    xlsxWorkbook = openpyxl.load_workbook(sourceDataFilename, data_only=True, read_only=True)
+
+    printAvailableWorksheetsIn(sourceDataFilename, xlsxWorkbook, contentSheetname)
+
+    rows = None
+    if contentSheetname in xlsxWorkbook.sheetnames:
+        sheet = xlsxWorkbook[contentSheetname]
+        # Read the sheet once in a single forward pass instead of accessing each cell per output file.
+        rows = list(sheet.iter_rows(min_row=contentStartRow, max_col=maxColumn, values_only=True))
+
+    # A read-only workbook keeps the file open until it is closed explicitly.
+    xlsxWorkbook.close()
+
+    return rows
+
+
+def convertCalamineValue(value):
+    """Convert a cell value returned by python-calamine to the value returned by openpyxl.
+    calamine returns empty cells as "", all numbers as float and date cells as date.
+    openpyxl returns None, int for integral numbers and datetime.
+    """
+
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        return datetime.datetime.combine(value, datetime.time())
+
+    return value
+
+
+def readContentRowsWithCalamine(sourceDataFilename, contentSheetname, contentStartRow, maxColumn):
+    """Read the content rows with python-calamine. See readContentRows().
+    """
+
+    # The workbook keeps the file open until it is closed.
+    with CalamineWorkbook.from_path(sourceDataFilename) as calamineWorkbook:
+        printAvailableCalamineWorksheetsIn(sourceDataFilename, calamineWorkbook, contentSheetname)
+
+        if contentSheetname not in calamineWorkbook.sheet_names:
+            return None
+
+        sheet = calamineWorkbook.get_sheet_by_name(contentSheetname)
+        # skip_empty_area=False ensures that the first list element is the first row of the sheet.
+        data = sheet.to_python(skip_empty_area=False)
+
+    # The rows are only as long as the used area of the sheet.
+    # Convert them to the same tuples of maxColumn values as returned by openpyxl.
+    rows = []
+    for values in data[contentStartRow-1:]:
+        row = tuple(convertCalamineValue(value) for value in values[:maxColumn])
+        rows.append(row + (None,) * (maxColumn - len(row)))
+
+    return rows
+
+
+def readContentRows(sourceDataFilename, contentSheetname, contentStartRow, maxColumn):
+    """Read the cell values of the content sheet in the xlsx file.
+    python-calamine is used if it is installed, otherwise openpyxl.
+
+    Parameters
+    ----------
+    sourceDataFilename : string
+        The xlsx filename.
+    contentSheetname : string
+        Name of the sheet to be read.
+    contentStartRow : int (first row is 1)
+        Index of xlsx row where the content starts.
+    maxColumn : int (first column is 1)
+        Index of the last xlsx column to be read.
+
+    Returns
+    -------
+    rows : list of tuple
+        For each row starting at contentStartRow a tuple of the cell values of the columns 1 to maxColumn.
+        The columns are accessed by index (first column is 0). Empty cells are None.
+        None if the sheet is not available.
+    """
+
+    if CalamineWorkbook is not None:
+        return readContentRowsWithCalamine(sourceDataFilename, contentSheetname, contentStartRow, maxColumn)
+
+    return readContentRowsWithOpenpyxl(sourceDataFilename, contentSheetname, contentStartRow, maxColumn)
+
+
 def xlx2docx(myConfig):
     """Load xlsx workbook and generate docx output.
 
@@ -363,6 +852,8 @@ def xlx2docx(myConfig):
     contentColumns     = myConfig["sourceData"    ]["contentColumns"   ]
     templateFilename   = myConfig["template"      ]["filename"         ]
     outputFilenames    = myConfig["generatedData" ]["filenames"        ]
+    # Optional, see useFastTextReplace.
+    fastTextReplace    = myConfig["template"      ].get("fastTextReplace", False)
 
     print("Configuration:\n",
           "Source data file          '" , sourceDataFilename ,     "'\n" ,
@@ -373,36 +864,30 @@ def xlx2docx(myConfig):
           "using replace from column "  , replaceColumn      ,     "\n"  ,
           "using content columns     "  , contentColumns     ,     "\n"  ,
           "using template file       '" , templateFilename   ,     "'\n" ,
+          "fast text replace         "  , fastTextReplace    ,     "\n"  ,
           "to generate files         "  , outputFilenames    , sep=""    ,
           )
 
     #######################################################################################
     # Load xlsx source data.
     #######################################################################################
-    # If data_only is true, then the formulas are replaced by value. 
-    # The values are not evaluated by docx. 
-    # The values were generated by MS-Excel at the time of last edit and stored within the file.
-    xlsxWorkbook = openpyxl.load_workbook(sourceDataFilename, data_only=True) 
-
-    printAvailableWorksheetsIn(sourceDataFilename, xlsxWorkbook, contentSheetname)
+    maxColumn = max(commandColumn, styleColumn, replaceColumn, *contentColumns)
+    rows = readContentRows(sourceDataFilename, contentSheetname, contentStartRow, maxColumn)
 
     #######################################################################################
     # Generate MS-Word files from MS-Excel columns.
     #######################################################################################
-    for sheetname in xlsxWorkbook.sheetnames:
-        if sheetname == contentSheetname:
-            sheet = xlsxWorkbook[contentSheetname]
-            generateDocxFromXlsx(
-                sheet            = sheet            ,
-                contentStartRow  = contentStartRow  ,
-                commandColumn    = commandColumn    ,
-                styleColumn      = styleColumn      ,
-                replaceColumn    = replaceColumn    ,
-                contentColumns   = contentColumns   ,
-                templateFilename = templateFilename ,
-                outputFilenames  = outputFilenames  ,
-                )
-            break
+    if rows is not None:
+        generateDocxFromXlsx(
+            rows             = rows             ,
+            commandColumn    = commandColumn    ,
+            styleColumn      = styleColumn      ,
+            replaceColumn    = replaceColumn    ,
+            contentColumns   = contentColumns   ,
+            templateFilename = templateFilename ,
+            outputFilenames  = outputFilenames  ,
+            fastTextReplace  = fastTextReplace  ,
+            )
 
 
 def printHelp():
@@ -426,6 +911,9 @@ def main():
     """
     configurationFilename = "xlsx2docx-byColumns_Configuration.toml"
 
+    # Use level=logging.DEBUG to log each replaced paragraph.
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     if len(sys.argv) > 1:
         if sys.argv[1] == "--version":
             print(f"{__file__} V{__version__}")
@@ -444,4 +932,6 @@ def main():
 
 if __name__ == "__main__":
     # execute only if run as a script
+    # freeze_support() is required for the worker processes of the standalone executable on MS-Windows.
+    multiprocessing.freeze_support()
     main()